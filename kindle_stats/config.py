@@ -1,22 +1,31 @@
 import json
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
+
 CONFIG_PATH = Path(__file__).resolve().parent.parent / "config.json"
 
 
+@lru_cache(maxsize=1)
 def load_config():
     if CONFIG_PATH.exists():
-        return json.loads(CONFIG_PATH.read_text())
+        return orjson.loads(CONFIG_PATH.read_bytes())
     return {}
 
 
 def save_config(config):
     CONFIG_PATH.write_text(json.dumps(config, indent=2) + "\n")
+    load_config.cache_clear()
 
 
 def get_config():
     """Load config, prompting for missing values on first run."""
-    config = load_config()
+    # Copy so callers (and the prompts below) never mutate the cached dict
+    config = dict(load_config())
+    if {"bw_item", "op_vault", "op_item"} <= config.keys():
+        return config
+
     changed = False
 
     if "bw_item" not in config:
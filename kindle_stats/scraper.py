@@ -1,18 +1,92 @@
+import asyncio
 import json
+import os
 import subprocess
 import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
-from playwright.sync_api import sync_playwright
+import orjson
+from playwright.async_api import async_playwright
 
 DASHBOARD_URL = "https://www.amazon.com/parentdashboard/activities/household-summary"
 ACTIVITIES_API = "https://www.amazon.com/parentdashboard/ajax/get-weekly-activities-v2"
 AJAX_PREFIX = "/parentdashboard/ajax/"
+CSRF_COOKIE = "ft-panda-csrf-token"
 BOOTSTRAP_LOOKBACK_DAYS = 120
 TIME_ZONE = "America/Los_Angeles"
 DATE_FORMAT = "%Y-%m-%d"
+MAX_CONCURRENT_WEEKS = 5
+RETRY_STATUSES = (429, 503)
+MAX_BACKOFF_SECONDS = 5.0
+STORAGE_STATE_PATH = Path("data/storage.json")
+
+# Fetches every [childId, startTime, endTime] request from inside the page,
+# keeping at most `limit` requests in flight. Results come back in request order.
+FETCH_WEEKS_JS = """
+async ([url, requests, csrfToken, timeZone, limit]) => {
+    const fetchWeek = async ([childId, startTime, endTime]) => {
+        try {
+            const resp = await fetch(url, {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json;charset=UTF-8',
+                    'x-amzn-csrf': csrfToken,
+                    'Accept': 'application/json',
+                },
+                body: JSON.stringify({
+                    childDirectedId: childId,
+                    startTime: startTime,
+                    endTime: endTime,
+                    aggregationInterval: 86400,
+                    timeZone: timeZone,
+                }),
+            });
+            const text = await resp.text();
+            let body;
+            try {
+                body = JSON.parse(text);
+            } catch {
+                body = { _raw_text: text.substring(0, 500) };
+            }
+            return { status: resp.status, body: body };
+        } catch (e) {
+            return { status: 0, body: { _error: e.message } };
+        }
+    };
+
+    const results = new Array(requests.length);
+    let next = 0;
+    const worker = async () => {
+        while (next < requests.length) {
+            const i = next++;
+            results[i] = await fetchWeek(requests[i]);
+        }
+    };
+    await Promise.all(
+        Array.from({ length: Math.min(limit, requests.length) }, worker)
+    );
+    return results;
+}
+"""
+
+
+@lru_cache(maxsize=4096)
+def _date_for_ts(ts):
+    """Format a Unix timestamp as a YYYY-MM-DD date in TIME_ZONE."""
+    return datetime.fromtimestamp(ts, tz=ZoneInfo(TIME_ZONE)).strftime(DATE_FORMAT)
+
+
+def _response_body(resp):
+    """Return the JSON body of a captured response, parsing its raw bytes on first use."""
+    if "body" not in resp:
+        try:
+            resp["body"] = orjson.loads(resp.pop("_bytes"))
+        except orjson.JSONDecodeError:
+            resp["body"] = {}
+    return resp["body"]
 
 
 class KindleParentDashboard:
@@ -20,6 +94,7 @@ class KindleParentDashboard:
         self.bw_item = bw_item
         self.op_vault = op_vault
         self.op_item = op_item
+        self._creds = None
 
     @staticmethod
     def _bw_get_field(item_name, field):
@@ -43,17 +118,42 @@ class KindleParentDashboard:
         value = jq_result.stdout.strip()
         return value if value and value != "null" else None
 
-    @staticmethod
-    def _op_read(ref):
-        """Read a value using a 1Password secret reference (fallback)."""
-        script_path = Path(__file__).parent.parent / "op_read_auto.sh"
-        result = subprocess.run(
-            [str(script_path), ref],
-            capture_output=True, text=True,
-        )
+    def _op_get_item(self, auto_approve=True):
+        """Read username, password and current OTP from 1Password in one call (fallback).
+
+        With auto_approve the call goes through op_read_auto.sh, which sends a
+        keystroke to accept the authorization dialog. Pass False once `op` is
+        already authorized so no stray keystroke reaches the browser.
+        """
+        if auto_approve:
+            script_path = Path(__file__).parent.parent / "op_read_auto.sh"
+            cmd = [str(script_path)]
+        else:
+            cmd = ["op"]
+        cmd += ["item", "get", self.op_item or self.bw_item, "--format", "json"]
+        if self.op_vault:
+            cmd += ["--vault", self.op_vault]
+        result = subprocess.run(cmd, capture_output=True, text=True)
         if result.returncode != 0:
-            raise RuntimeError(f"op read failed for '{ref}': {result.stderr.strip()}")
-        return result.stdout.strip()
+            raise RuntimeError(f"op item get failed: {result.stderr.strip()}")
+
+        item = {"username": None, "password": None, "otp": None}
+        for field in json.loads(result.stdout).get("fields", []):
+            if field.get("type") == "OTP":
+                item["otp"] = field.get("totp")
+            elif field.get("id") in ("username", "password"):
+                item[field["id"]] = field.get("value")
+        return item
+
+    def _op_get_login(self):
+        """Username and password from 1Password, cached so `op` is only spawned once.
+
+        The OTP is deliberately not cached: it would expire before Amazon asks for it.
+        """
+        if self._creds is None:
+            item = self._op_get_item()
+            self._creds = {"username": item["username"], "password": item["password"]}
+        return self._creds
 
     def _get_credential(self, field_name):
         """Get a credential, trying Bitwarden first then falling back to 1Password."""
@@ -65,10 +165,12 @@ class KindleParentDashboard:
                 return value
             print(f"  Bitwarden lookup failed for {field_name}, falling back to 1Password...")
         if self.op_vault and self.op_item:
-            return self._op_read(f"op://{self.op_vault}/{self.op_item}/{field_name}")
+            value = self._op_get_login().get(field_name)
+            if value:
+                return value
         raise RuntimeError(f"Could not retrieve '{field_name}' from Bitwarden or 1Password")
 
-    def _wait_for_dashboard(self, page, timeout_seconds=120):
+    async def _wait_for_dashboard(self, page, timeout_seconds=120):
         """Wait for the page to navigate away from sign-in to the dashboard."""
         print(f"Waiting up to {timeout_seconds}s for login to complete...")
         print("Complete any verification in the browser window.")
@@ -78,42 +180,45 @@ class KindleParentDashboard:
             if "parentdashboard" in url and "/ap/" not in url:
                 print("Login successful!")
                 return True
-            time.sleep(1)
+            await asyncio.sleep(1)
         raise TimeoutError("Login did not complete within timeout.")
 
-    def _do_login(self, page):
+    async def _do_login(self, page, debug=False):
         """Handle Amazon sign-in using Bitwarden (with 1Password fallback)."""
         print(f"Fetching credentials for '{self.bw_item}'...")
         email = self._get_credential("username")
         password = self._get_credential("password")
 
-        Path("data").mkdir(exist_ok=True)
+        if debug:
+            Path("data").mkdir(exist_ok=True)
 
         # Fill email
         email_input = page.locator('#ap_email')
-        if email_input.is_visible(timeout=5000):
-            email_input.click()
-            email_input.fill(email)
-            page.wait_for_timeout(500)
-            page.locator('#continue').first.click()
-            page.wait_for_load_state("networkidle")
+        if await email_input.is_visible(timeout=5000):
+            await email_input.click()
+            await email_input.fill(email)
+            await page.wait_for_timeout(500)
+            await page.locator('#continue').first.click()
+            await page.wait_for_load_state("networkidle")
             print(f"  After email: {page.url}")
 
         # Fill password — use click + type to trigger Amazon's JS validation
         password_input = page.locator('#ap_password')
-        if password_input.is_visible(timeout=5000):
-            password_input.click()
-            password_input.type(password, delay=20)
-            page.wait_for_timeout(500)
-            page.screenshot(path="data/debug_pre_submit.png")
-            page.locator('#signInSubmit').click()
-            page.wait_for_load_state("networkidle")
+        if await password_input.is_visible(timeout=5000):
+            await password_input.click()
+            await password_input.type(password, delay=20)
+            await page.wait_for_timeout(500)
+            if debug:
+                await page.screenshot(path="data/debug_pre_submit.png")
+            await page.locator('#signInSubmit').click()
+            await page.wait_for_load_state("networkidle")
             print(f"  After password: {page.url}")
-            page.screenshot(path="data/debug_post_password.png")
+            if debug:
+                await page.screenshot(path="data/debug_post_password.png")
 
         # Attempt OTP if Amazon asks for it
         otp_input = page.locator('#auth-mfa-otpcode')
-        if otp_input.is_visible(timeout=5000):
+        if await otp_input.is_visible(timeout=5000):
             otp = None
             # Try Bitwarden TOTP first
             bw_result = subprocess.run(
@@ -124,25 +229,61 @@ class KindleParentDashboard:
                 otp = bw_result.stdout.strip()
                 print("  Filling OTP from Bitwarden...")
             else:
-                # Fall back to 1Password
-                op_result = subprocess.run(
-                    ["op", "item", "get", self.op_item or self.bw_item, "--otp"],
-                    capture_output=True, text=True,
-                )
-                if op_result.returncode == 0 and op_result.stdout.strip():
-                    otp = op_result.stdout.strip()
+                # Fall back to 1Password, reading a fresh code now. Call op directly:
+                # the wrapper's keystroke would land in the focused MFA page
+                try:
+                    otp = self._op_get_item(auto_approve=False).get("otp")
+                except RuntimeError:
+                    otp = None
+                if otp:
                     print("  Filling OTP from 1Password...")
             if otp:
-                otp_input.click()
-                otp_input.type(otp, delay=20)
-                page.wait_for_timeout(500)
-                page.locator('#auth-signin-button').click()
+                # fill() replaces any stray input already in the field
+                await otp_input.fill(otp)
+                await page.wait_for_timeout(500)
+                await page.locator('#auth-signin-button').click()
 
         # Wait for dashboard regardless of which step we're at
         if "/ap/" in page.url:
-            self._wait_for_dashboard(page)
+            await self._wait_for_dashboard(page)
+
+    @staticmethod
+    def _needs_login(page):
+        """True when the page has been redirected to an Amazon sign-in step."""
+        return "/ap/signin" in page.url or "/ap/challenge" in page.url
+
+    @staticmethod
+    async def _save_storage_state(context):
+        """Persist the browser session, readable only by the owner (it holds auth cookies)."""
+        Path("data").mkdir(exist_ok=True)
+        state = await context.storage_state()
+        fd = os.open(STORAGE_STATE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(state))
+        # os.open's mode only applies on creation, so tighten older files too
+        STORAGE_STATE_PATH.chmod(0o600)
+        print(f"Session saved to {STORAGE_STATE_PATH}")
 
-    def fetch_reading_data(self, debug=False, start_date=None):
+    @staticmethod
+    async def _open_dashboard(p, handle_response, storage_state=None):
+        """Launch Chromium and navigate to the dashboard.
+
+        With a saved storage_state the browser runs headless; otherwise a
+        visible window is opened so any login verification can be completed.
+        """
+        browser = await p.chromium.launch(headless=storage_state is not None)
+        context = await browser.new_context(
+            viewport={"width": 1280, "height": 900},
+            storage_state=storage_state,
+        )
+        page = await context.new_page()
+        page.on("response", handle_response)
+
+        print("Navigating to Parent Dashboard...")
+        await page.goto(DASHBOARD_URL, wait_until="domcontentloaded")
+        return browser, context, page
+
+    async def fetch_reading_data(self, debug=False, start_date=None):
         """Logs in, navigates to dashboard, then calls the activities API
         for every week from the provided start_date (inclusive) to now."""
         tz = ZoneInfo(TIME_ZONE)
@@ -155,10 +296,15 @@ class KindleParentDashboard:
                 f"last {BOOTSTRAP_LOOKBACK_DAYS} days)"
             )
 
+        # Nothing can have been recorded yet, so don't bother launching a browser
+        if fetch_start > datetime.now(tz).date():
+            print("No fetch needed: start date is in the future")
+            return self._extract_reading_info([], debug)
+
         # We intercept the initial page load to discover the childDirectedId
         initial_responses = []
 
-        def handle_response(response):
+        async def handle_response(response):
             url = response.url
             if AJAX_PREFIX not in url:
                 return
@@ -166,64 +312,61 @@ class KindleParentDashboard:
             if "json" not in content_type:
                 return
             try:
-                body = response.json()
+                # Keep the raw bytes; they're only parsed if something reads the body
                 initial_responses.append({
                     "url": url,
                     "status": response.status,
-                    "body": body,
+                    "_bytes": await response.body(),
                 })
             except Exception:
                 pass
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=False)
-            context = browser.new_context(viewport={"width": 1280, "height": 900})
-            page = context.new_page()
-            page.on("response", handle_response)
+        async with async_playwright() as p:
+            storage_state = str(STORAGE_STATE_PATH) if STORAGE_STATE_PATH.exists() else None
+            if storage_state:
+                print(f"Reusing saved session from {STORAGE_STATE_PATH}")
+            browser, context, page = await self._open_dashboard(p, handle_response, storage_state)
 
-            print("Navigating to Parent Dashboard...")
-            page.goto(DASHBOARD_URL, wait_until="networkidle")
+            # Saved session expired — reopen with a visible window for login
+            if storage_state and self._needs_login(page):
+                print("Saved session expired, relaunching browser for sign-in...")
+                await context.close()
+                await browser.close()
+                initial_responses.clear()
+                browser, context, page = await self._open_dashboard(p, handle_response)
 
             # If we hit a sign-in page, log in
-            if "/ap/signin" in page.url or "/ap/challenge" in page.url:
+            if self._needs_login(page):
                 print("Sign-in required...")
-                self._do_login(page)
-                page.wait_for_load_state("load")
+                await self._do_login(page, debug)
+                await page.wait_for_load_state("load")
 
             print(f"Landed on: {page.url}")
-            print(f"Page title: {page.title()}")
+            print(f"Page title: {await page.title()}")
+
+            # Re-save on every successful landing so refreshed cookies are kept
+            await self._save_storage_state(context)
 
             if debug:
                 Path("data").mkdir(exist_ok=True)
-                page.screenshot(path="data/debug_landing.png", full_page=True)
+                await page.screenshot(path="data/debug_landing.png", full_page=True)
                 print("Screenshot saved to data/debug_landing.png")
 
-            # Wait a moment for all initial API calls to fire
-            page.wait_for_timeout(3000)
+            # Wait for the get-household response and CSRF cookie to show up
+            children, csrf_token = await self._poll_ready(initial_responses, context)
 
             if debug:
                 print(f"\n--- Initial API responses: {len(initial_responses)} ---")
                 for r in initial_responses:
                     print(f"  {r['status']} {r['url']}")
 
-            # Extract CSRF token from cookies
-            cookies = context.cookies()
-            csrf_token = None
-            for cookie in cookies:
-                if cookie["name"] == "ft-panda-csrf-token":
-                    csrf_token = cookie["value"]
-                    break
-
             if not csrf_token:
                 print("WARNING: Could not find CSRF token in cookies.")
                 if debug:
                     print("Cookies found:")
-                    for c in cookies:
+                    for c in await context.cookies():
                         print(f"  {c['name']}")
 
-            # Discover children from the get-household response
-            children = self._find_child_ids(initial_responses)
-
             print(f"Found children: {children or 'none'}")
             print(f"CSRF token: {'found' if csrf_token else 'NOT FOUND'}")
 
@@ -231,21 +374,42 @@ class KindleParentDashboard:
             all_api_responses = list(initial_responses)
 
             if children and csrf_token:
-                for child_id, child_name in children.items():
-                    print(f"\nFetching history for {child_name} ({child_id})...")
-                    responses = self._fetch_all_weeks(
-                        page, child_id, csrf_token, fetch_start, debug
-                    )
-                    all_api_responses.extend(responses)
+                names = ", ".join(children.values())
+                print(f"\nFetching history for {names}...")
+                responses = await self._fetch_all_weeks(
+                    page, children, csrf_token, fetch_start, debug
+                )
+                all_api_responses.extend(responses)
             elif not csrf_token:
                 print("\nNo CSRF token found — cannot fetch historical data.")
             elif not children:
                 print("\nNo children found in household response.")
 
-            context.close()
-            browser.close()
+            await context.close()
+            await browser.close()
+
+        return self._extract_reading_info(all_api_responses, debug)
 
-        return self._extract_reading_info(all_api_responses)
+    async def _poll_ready(self, initial_responses, context, timeout=10):
+        """Wait until child IDs and the CSRF cookie are both available.
+
+        Polls every 100ms, backing off exponentially up to 1s between checks.
+        Returns (children, csrf_token) as soon as both are found, or whatever
+        was found when the timeout expires.
+        """
+        deadline = time.time() + timeout
+        interval = 0.1
+        while True:
+            children = self._find_child_ids(initial_responses)
+            csrf_token = None
+            for cookie in await context.cookies():
+                if cookie["name"] == CSRF_COOKIE:
+                    csrf_token = cookie["value"]
+                    break
+            if (children and csrf_token) or time.time() >= deadline:
+                return children, csrf_token
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, 1.0)
 
     @staticmethod
     def _resolve_start_date(start_date, tz):
@@ -267,109 +431,112 @@ class KindleParentDashboard:
 
     def _find_child_ids(self, responses):
         """Extract child directedIds from the get-household API response."""
-        child_ids = {}
         for resp in responses:
-            body = resp.get("body", {})
+            if "get-household" not in resp.get("url", ""):
+                continue
+            body = _response_body(resp)
             if "members" not in body:
                 continue
-            for member in body["members"]:
-                if member.get("role") == "CHILD" and member.get("directedId"):
-                    child_ids[member["directedId"]] = member.get("firstName", "Unknown")
-        return child_ids
-
-    def _fetch_all_weeks(self, page, child_id, csrf_token, start_date, debug=False):
-        """Call the activities API for every week from start_date to now."""
+            return {
+                member["directedId"]: member.get("firstName", "Unknown")
+                for member in body["members"]
+                if member.get("role") == "CHILD" and member.get("directedId")
+            }
+        return {}
+
+    async def _fetch_all_weeks(self, page, children, csrf_token, start_date, debug=False):
+        """Call the activities API for every child and week from start_date to now.
+
+        All requests are fetched by one in-browser batch on the dashboard page
+        (which has the amazon.com origin and cookies the API needs), capped at
+        MAX_CONCURRENT_WEEKS in-flight requests in total.
+        """
         tz = ZoneInfo(TIME_ZONE)
         start = datetime.combine(start_date, datetime.min.time(), tzinfo=tz)
         now = datetime.now(tz)
 
-        if start >= now:
-            print(f"  No fetch needed for {child_id}: start date is in the future")
-            return []
-
-        responses = []
         week_seconds = 7 * 86400
         current_start = int(start.timestamp())
         end_ts = int(now.timestamp())
 
-        total_weeks = (end_ts - current_start) // week_seconds + 1
-        week_num = 0
-
+        ranges = []
         while current_start < end_ts:
             current_end = min(current_start + week_seconds, end_ts)
-            week_num += 1
-
-            result = page.evaluate("""
-                async ([url, childId, startTime, endTime, csrfToken, timeZone]) => {
-                    try {
-                        const resp = await fetch(url, {
-                            method: 'POST',
-                            headers: {
-                                'Content-Type': 'application/json;charset=UTF-8',
-                                'x-amzn-csrf': csrfToken,
-                                'Accept': 'application/json',
-                            },
-                            body: JSON.stringify({
-                                childDirectedId: childId,
-                                startTime: startTime,
-                                endTime: endTime,
-                                aggregationInterval: 86400,
-                                timeZone: timeZone,
-                            }),
-                        });
-                        const text = await resp.text();
-                        let body;
-                        try {
-                            body = JSON.parse(text);
-                        } catch {
-                            body = { _raw_text: text.substring(0, 500) };
-                        }
-                        return { status: resp.status, body: body };
-                    } catch (e) {
-                        return { status: 0, body: { _error: e.message } };
-                    }
-                }
-            """, [ACTIVITIES_API, child_id, current_start, current_end, csrf_token, TIME_ZONE])
-
-            status = result["status"]
-            body = result["body"]
-
-            start_date = datetime.fromtimestamp(current_start, tz=tz).strftime("%Y-%m-%d")
-            end_date = datetime.fromtimestamp(current_end, tz=tz).strftime("%Y-%m-%d")
-
-            if status == 200:
-                responses.append({
-                    "url": ACTIVITIES_API,
-                    "status": status,
-                    "body": body,
-                    "query": {
-                        "childDirectedId": child_id,
-                        "startTime": current_start,
-                        "endTime": current_end,
-                    },
-                })
-                print(f"  Week {week_num}/{total_weeks}: {start_date} to {end_date} - OK")
-            else:
-                print(f"  Week {week_num}/{total_weeks}: {start_date} to {end_date} - HTTP {status}")
-                if debug:
-                    print(f"    Response: {json.dumps(body)[:200]}")
-
+            ranges.append((current_start, current_end))
             current_start = current_end
-            # Small delay to avoid rate limiting
-            time.sleep(0.3)
+
+        total_weeks = len(ranges)
+        requests = [
+            (child_id, week_start, week_end)
+            for child_id in children
+            for week_start, week_end in ranges
+        ]
+
+        async def fetch_batch(batch):
+            return await page.evaluate(
+                FETCH_WEEKS_JS,
+                [ACTIVITIES_API, batch, csrf_token, TIME_ZONE, MAX_CONCURRENT_WEEKS],
+            )
+
+        results = await fetch_batch(requests)
+
+        # Only back off when Amazon actually rate limits us, doubling the wait
+        # for each retry of the throttled weeks up to MAX_BACKOFF_SECONDS
+        backoff = 0.0
+        pending = [i for i, r in enumerate(results) if r["status"] in RETRY_STATUSES]
+        while pending and backoff < MAX_BACKOFF_SECONDS:
+            backoff = min(max(backoff * 2, 0.5), MAX_BACKOFF_SECONDS)
+            print(f"  {len(pending)} week(s) rate limited, retrying in {backoff:g}s...")
+            await asyncio.sleep(backoff)
+            retried = await fetch_batch([requests[i] for i in pending])
+            for i, result in zip(pending, retried):
+                results[i] = result
+            pending = [i for i in pending if results[i]["status"] in RETRY_STATUSES]
+
+        responses = []
+        for child_num, (child_id, child_name) in enumerate(children.items()):
+            print(f"\n  Results for {child_name} ({child_id}):")
+            child_results = results[child_num * total_weeks:(child_num + 1) * total_weeks]
+            for week_num, ((week_start, week_end), result) in enumerate(
+                zip(ranges, child_results), start=1
+            ):
+                status = result["status"]
+                body = result["body"]
+
+                start_label = _date_for_ts(week_start)
+                end_label = _date_for_ts(week_end)
+
+                if status == 200:
+                    responses.append({
+                        "url": ACTIVITIES_API,
+                        "status": status,
+                        "body": body,
+                        "query": {
+                            "childDirectedId": child_id,
+                            "startTime": week_start,
+                            "endTime": week_end,
+                        },
+                    })
+                    print(f"  Week {week_num}/{total_weeks}: {start_label} to {end_label} - OK")
+                else:
+                    print(f"  Week {week_num}/{total_weeks}: {start_label} to {end_label} - HTTP {status}")
+                    if debug:
+                        print(f"    Response: {orjson.dumps(body).decode()[:200]}")
 
         return responses
 
-    def _extract_reading_info(self, responses):
-        """Parses the activityV2Data structure from API responses."""
-        tz = ZoneInfo(TIME_ZONE)
+    def _extract_reading_info(self, responses, debug=False):
+        """Parses the activityV2Data structure from API responses.
+
+        The raw API responses are only included in the result when debug is set.
+        """
         reading_activity = []
 
-        for resp in responses:
-            url = resp.get("url", "")
-            body = resp.get("body", {})
+        weekly = [r for r in responses if "get-weekly-activities" in r.get("url", "")]
 
-            if "get-weekly-activities" not in url or not isinstance(body, dict):
+        for resp in weekly:
+            body = _response_body(resp)
+            if not isinstance(body, dict):
                 continue
 
             for category_data in body.get("activityV2Data", []):
@@ -379,7 +546,7 @@ class KindleParentDashboard:
                     if start_ts is None or duration_secs == 0:
                         continue
 
-                    date_str = datetime.fromtimestamp(start_ts, tz=tz).strftime("%Y-%m-%d")
+                    date_str = _date_for_ts(start_ts)
                     books = []
                     for result in interval.get("aggregatedActivityResults", []):
                         attrs = result.get("attributes", {})
@@ -401,8 +568,12 @@ class KindleParentDashboard:
         # Sort by date
         reading_activity.sort(key=lambda x: x["date"])
 
-        return {
+        result = {
             "fetched_at": datetime.now(timezone.utc).isoformat(),
             "reading_activity": reading_activity,
-            "raw_responses": responses,
         }
+        if debug:
+            result["raw_responses"] = responses
+            for resp in responses:
+                _response_body(resp)
+        return result
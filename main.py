@@ -1,52 +1,75 @@
 import argparse
-import json
+import asyncio
+import os
+import re
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
+import orjson
+
 from kindle_stats.config import get_config
 from kindle_stats.scraper import KindleParentDashboard
 
-MERGED_FILE = Path("data/reading_data.json")
+ACTIVITY_FILE = Path("data/reading_activity.ndjson")
+LEGACY_MERGED_FILE = Path("data/reading_data.json")
 DATE_FORMAT = "%Y-%m-%d"
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
 
 def load_existing():
-    """Load the merged data file if it exists."""
-    if MERGED_FILE.exists():
-        return json.loads(MERGED_FILE.read_text())
-    return {"reading_activity": []}
+    """Load reading activity from the NDJSON store (one day per line).
+
+    Falls back to the legacy reading_data.json file if the store doesn't exist yet.
+    """
+    if ACTIVITY_FILE.exists():
+        return [orjson.loads(line) for line in ACTIVITY_FILE.read_bytes().splitlines() if line.strip()]
+    if LEGACY_MERGED_FILE.exists():
+        return orjson.loads(LEGACY_MERGED_FILE.read_bytes()).get("reading_activity", [])
+    return []
+
+
+def save_activity(reading_activity):
+    """Atomically rewrite the NDJSON store with one day per line."""
+    tmp_path = ACTIVITY_FILE.with_name(ACTIVITY_FILE.name + ".tmp")
+    tmp_path.write_bytes(b"".join(orjson.dumps(entry) + b"\n" for entry in reading_activity))
+    os.replace(tmp_path, ACTIVITY_FILE)
 
 
 def merge_activity(existing, new_entries):
     """Merge new reading activity into existing, deduplicating by date.
     For duplicate dates, keeps the entry with the most books (freshest data)."""
-    by_date = {}
-    for entry in existing:
-        by_date[entry["date"]] = entry
+    # Map date -> (book count, entry) so each entry's book count is computed once
+    by_date = {entry["date"]: (len(entry.get("books", ())), entry) for entry in existing}
     for entry in new_entries:
         date = entry["date"]
-        if date not in by_date or len(entry.get("books", [])) >= len(by_date[date].get("books", [])):
-            by_date[date] = entry
-    return sorted(by_date.values(), key=lambda x: x["date"])
+        num_books = len(entry.get("books", ()))
+        current = by_date.get(date)
+        if current is None or num_books >= current[0]:
+            by_date[date] = (num_books, entry)
+    return sorted((entry for _, entry in by_date.values()), key=itemgetter("date"))
 
 
 def latest_existing_date(reading_activity):
-    """Return the latest valid date in reading_activity, or None if unavailable."""
-    latest = None
-    for entry in reading_activity:
-        date_str = entry.get("date")
-        if not date_str:
-            continue
+    """Return the latest valid date in reading_activity, or None if unavailable.
+
+    ISO YYYY-MM-DD strings sort chronologically, so candidates are compared as
+    strings and only parsed to reject impossible dates like 2025-02-30.
+    """
+    candidates = sorted(
+        (entry["date"] for entry in reading_activity if _ISO_DATE_RE.match(entry.get("date") or "")),
+        reverse=True,
+    )
+    for date_str in candidates:
         try:
-            entry_date = datetime.strptime(date_str, DATE_FORMAT).date()
+            datetime.strptime(date_str, DATE_FORMAT)
         except ValueError:
             continue
-        if latest is None or entry_date > latest:
-            latest = entry_date
-    return latest.strftime(DATE_FORMAT) if latest else None
+        return date_str
+    return None
 
 
-def main():
+async def main():
     parser = argparse.ArgumentParser(description="Kindle Kids Reading Data Scraper")
     parser.add_argument(
         "--debug", action="store_true",
@@ -60,8 +83,7 @@ def main():
         op_vault=config.get("op_vault"),
         op_item=config.get("op_item"),
     )
-    existing = load_existing()
-    old_activity = existing.get("reading_activity", [])
+    old_activity = load_existing()
     start_date = latest_existing_date(old_activity)
 
     if start_date:
@@ -69,7 +91,7 @@ def main():
     else:
         print("  No existing reading history found; using automatic bootstrap window")
 
-    data = dashboard.fetch_reading_data(
+    data = await dashboard.fetch_reading_data(
         debug=args.debug,
         start_date=start_date,
     )
@@ -81,25 +103,26 @@ def main():
     Path("data").mkdir(exist_ok=True)
     timestamp = datetime.now().strftime("%Y-%m-%dT%H%M%S")
     raw_path = Path(f"data/fetch_{timestamp}.json")
-    raw_path.write_text(json.dumps(data, indent=2))
+    raw_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
     print(f"  Raw fetch saved to {raw_path}")
 
-    # Merge into the single canonical file
+    # Merge into the canonical activity store
     merged = merge_activity(old_activity, new_activity)
 
-    existing["reading_activity"] = merged
-    existing["last_updated"] = datetime.now().isoformat()
-
-    MERGED_FILE.write_text(json.dumps(existing, indent=2))
-
     new_days = len(merged) - len(old_activity)
     print(f"\n  Merged: {len(merged)} total days ({'+' + str(new_days) if new_days > 0 else new_days} new)")
     if merged:
         print(f"  Date range: {merged[0]['date']} to {merged[-1]['date']}")
     else:
         print("  Date range: no activity yet")
-    print(f"  Saved to {MERGED_FILE}")
+
+    # Same-day updates can change an entry without adding a day, so compare contents
+    if merged == old_activity and ACTIVITY_FILE.exists():
+        print(f"  No changes; {ACTIVITY_FILE} left as is")
+    else:
+        save_activity(merged)
+        print(f"  Saved to {ACTIVITY_FILE}")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
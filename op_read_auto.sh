@@ -1,8 +1,9 @@
 #!/bin/bash
-# Wrapper for `op read` that auto-approves the authorization dialog
+# Wrapper for `op` that auto-approves the authorization dialog
+# Usage: op_read_auto.sh <op subcommand and args...>
 
-# Run op read in background
-op read "$@" &
+# Run op in background
+op "$@" &
 PID=$!
 
 # Wait for auth dialog to appear and send spacebar